@@ -2,8 +2,13 @@
 Configuration constants for ePort protocol and machine settings
 """
 
+import array
+
 # CRC16 lookup table from Serial ePort Protocol Appendix B (page 21-22)
-CRC_TABLE = [
+# Stored as a typed uint16 array: one contiguous 512-byte C buffer instead of
+# 256 boxed Python ints, so lookups read raw values and the whole table fits
+# in a few cache lines
+CRC_TABLE = array.array('H', [
     0x0000, 0x1021, 0x2042, 0x3063, 0x4084, 0x50a5, 0x60c6, 0x70e7,
     0x8108, 0x9129, 0xa14a, 0xb16b, 0xc18c, 0xd1ad, 0xe1ce, 0xf1ef,
     0x1231, 0x0210, 0x3273, 0x2252, 0x52b5, 0x4294, 0x72f7, 0x62d6,
@@ -36,7 +41,7 @@ CRC_TABLE = [
     0x7c26, 0x6c07, 0x5c64, 0x4c45, 0x3ca2, 0x2c83, 0x1ce0, 0x0cc1,
     0xef1f, 0xff3e, 0xcf5d, 0xdf7c, 0xaf9b, 0xbfba, 0x8fd9, 0x9ff8,
     0x6e17, 0x7e36, 0x4e55, 0x5e74, 0x2e93, 0x3eb2, 0x0ed1, 0x1ef0
-]
+])
 
 # Protocol constants from Serial ePort Protocol
 RS = 0x1E  # Record Separator
@@ -49,6 +54,7 @@ NAK = 0x15  # Not-acknowledge
 SERIAL_PORT = '/dev/ttyUSB0'
 SERIAL_BAUDRATE = 9600
 SERIAL_TIMEOUT = 1
+SERIAL_WRITE_TIMEOUT = 1.0  # Max seconds for a command write before pyserial raises (keeps a wedged UART from hanging the main loop)
 
 # Machine hardware configuration
 MOTOR_PIN = 17
@@ -143,10 +143,11 @@ socket.on('change_state', (data) => {
     }
 });
 
-// WebSocket event: Update product counter
-socket.on('update_product', (data) => {
+// Apply a product counter update to the DOM (shared by the single-event
+// and combined-event handlers)
+function applyProductUpdate(data) {
     const { product_id, quantity, unit, price, is_active } = data;
-    
+
     // Update cached data
     if (productData[product_id]) {
         productData[product_id].qty = quantity;
@@ -175,14 +176,27 @@ socket.on('update_product', (data) => {
         // Always remove purchased class - all non-active products show original gray
         column.classList.remove('purchased');
     }
-});
+}
 
-// WebSocket event: Update total
-socket.on('update_total', (data) => {
+// Apply a transaction total update to the DOM
+function applyTotalUpdate(data) {
     const totalElement = document.getElementById('total-price');
     if (totalElement) {
         totalElement.textContent = `$${data.total.toFixed(2)}`;
     }
+}
+
+// WebSocket event: Update product counter
+socket.on('update_product', applyProductUpdate);
+
+// WebSocket event: Update total
+socket.on('update_total', applyTotalUpdate);
+
+// WebSocket event: Combined product + total update (one frame per
+// dispensing tick instead of two)
+socket.on('update_product_and_total', (data) => {
+    applyProductUpdate(data.product);
+    applyTotalUpdate(data);
 });
 
 // WebSocket event: Show receipt
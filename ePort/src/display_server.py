@@ -7,9 +7,39 @@ Provides real-time transaction updates via WebSocket to browser-based display.
 from flask import Flask, render_template
 from flask_socketio import SocketIO, emit
 from typing import List, Dict, Optional
+import json
+import socket
 import threading
+import time
 import logging
 
+# Use orjson's C serializer for WebSocket payloads when available (optional -
+# not in requirements.txt); fall back to the stdlib. Socket.IO accepts any
+# json-module-like object via its json= argument.
+try:
+    import orjson
+
+    class _OrjsonShim:
+        """json-module shim over orjson for python-socketio
+
+        orjson takes no encode options, so the keyword arguments
+        python-socketio passes (separators and friends) are accepted and
+        ignored; its bytes output is decoded to the str the transport
+        expects.
+        """
+
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        @staticmethod
+        def loads(data, **kwargs):
+            return orjson.loads(data)
+
+    _ws_json = _OrjsonShim
+except ImportError:
+    _ws_json = json
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,23 +51,47 @@ class DisplayServer:
     Provides real-time updates for product counters, totals, and state transitions.
     """
     
-    def __init__(self, host: str = 'localhost', port: int = 5000, products: List[Dict] = None):
+    def __init__(self, host: str = 'localhost', port: int = 5000, products: List[Dict] = None,
+                 coalesce_interval: float = 0.0):
         """
         Initialize Flask server with WebSocket support
-        
+
         Args:
             host: Server host address
             port: Server port number
             products: List of product dictionaries with id, name, unit, price_per_unit
+            coalesce_interval: If > 0, product/total updates are coalesced and
+                               flushed every this many seconds (e.g. 0.05)
+                               instead of emitted immediately. Successive
+                               updates to the same product within a window
+                               deduplicate (newest wins), so a fast flowmeter
+                               produces ~20 frames/s rather than one per pulse.
+                               0 (default) keeps immediate per-call emits.
         """
-        self.app = Flask(__name__, 
+        self.app = Flask(__name__,
                         template_folder='../display/templates',
                         static_folder='../display/static')
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        self.socketio = SocketIO(self.app, cors_allowed_origins="*", json=_ws_json)
         self.host = host
         self.port = port
         self.current_state = "idle"
         self.products = products or []
+
+        # Coalescing state: latest pending update per product plus the latest
+        # pending total, drained by a background flusher thread
+        self.coalesce_interval = coalesce_interval
+        self._pending_products: Dict[str, Dict] = {}
+        self._pending_total: Optional[float] = None
+        self._pending_lock = threading.Lock()
+        self._flusher_started = False
+
+        # Set once the server socket is accepting connections (see wait_ready)
+        self._ready = threading.Event()
+
+        # Last receipt payload, kept for redisplay (e.g. a client that
+        # connects or reloads while the receipt screen is up)
+        self._last_receipt: Optional[Dict] = None
+
         self._setup_routes()
         logger.info(f"DisplayServer initialized on {host}:{port}")
     
@@ -68,6 +122,10 @@ class DisplayServer:
             emit('change_state', {'state': self.current_state})
             if hasattr(self, 'products'):
                 emit('load_products', {'products': self.products})
+            # A client arriving mid-receipt gets the cached payload so the
+            # receipt screen isn't blank after a reload
+            if self.current_state == 'complete' and self._last_receipt is not None:
+                emit('show_receipt', self._last_receipt)
         
         @self.socketio.on('request_products')
         def handle_request_products():
@@ -97,6 +155,35 @@ class DisplayServer:
             logger.info("Display server started in background")
         else:
             self.socketio.run(self.app, host=self.host, port=self.port)
+
+    def wait_ready(self, timeout: float = 5.0) -> bool:
+        """
+        Block until the server socket is accepting connections
+
+        Lets callers start pushing state the moment the port is live
+        (typically well under 100ms) instead of guessing with a fixed sleep
+        after start().
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the server came up within the timeout, False otherwise
+        """
+        if self._ready.is_set():
+            return True
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                # Probe the port; success means the server thread has bound
+                # and is listening
+                with socket.create_connection((self.host, self.port), timeout=0.1):
+                    self._ready.set()
+                    return True
+            except OSError:
+                time.sleep(0.01)
+        return False
     
     def change_state(self, state: str) -> None:
         """
@@ -124,15 +211,53 @@ class DisplayServer:
             price: Current price for this product
             is_active: Whether this product is currently being dispensed
         """
-        self.socketio.emit('update_product', {
+        payload = {
             'product_id': product_id,
             'product_name': product_name,
             'quantity': quantity,
             'unit': unit,
             'price': price,
             'is_active': is_active
-        })
+        }
+        if self.coalesce_interval > 0:
+            with self._pending_lock:
+                self._pending_products[product_id] = payload
+            self._ensure_flusher()
+        else:
+            self.socketio.emit('update_product', payload)
     
+    def update_product_and_total(self, product_id: str, product_name: str,
+                                 quantity: float, unit: str, price: float,
+                                 total: float, is_active: bool = False) -> None:
+        """
+        Update a product counter and the transaction total in one event
+
+        During dispensing every tick changes both a product counter and the
+        total; sending them together halves the WebSocket frames (and TCP
+        writes) on the hottest display path versus calling update_product
+        then update_total.
+
+        Args:
+            product_id: Product identifier (soap_hand, soap_dish, soap_laundry)
+            product_name: Display name
+            quantity: Current quantity dispensed
+            unit: Unit of measurement (oz, ml)
+            price: Current price for this product
+            total: Current transaction total in dollars
+            is_active: Whether this product is currently being dispensed
+        """
+        self.socketio.emit('update_product_and_total', {
+            'product': {
+                'product_id': product_id,
+                'product_name': product_name,
+                'quantity': quantity,
+                'unit': unit,
+                'price': price,
+                'is_active': is_active
+            },
+            'total': total
+        })
+
     def update_total(self, total: float) -> None:
         """
         Update transaction total
@@ -140,7 +265,41 @@ class DisplayServer:
         Args:
             total: Current transaction total in dollars
         """
-        self.socketio.emit('update_total', {'total': total})
+        if self.coalesce_interval > 0:
+            with self._pending_lock:
+                self._pending_total = total
+            self._ensure_flusher()
+        else:
+            self.socketio.emit('update_total', {'total': total})
+
+    def _ensure_flusher(self):
+        """Start the coalescing flusher thread on first queued update"""
+        if self._flusher_started:
+            return
+        self._flusher_started = True
+        thread = threading.Thread(target=self._flush_loop)
+        thread.daemon = True
+        thread.start()
+
+    def _flush_loop(self):
+        """
+        Drain pending updates every coalesce_interval seconds
+
+        Emits the standard update_product / update_total events, so clients
+        need no changes - they just see at most one frame per product per
+        window instead of one per flowmeter pulse.
+        """
+        while True:
+            time.sleep(self.coalesce_interval)
+            with self._pending_lock:
+                products = list(self._pending_products.values())
+                self._pending_products.clear()
+                total = self._pending_total
+                self._pending_total = None
+            for payload in products:
+                self.socketio.emit('update_product', payload)
+            if total is not None:
+                self.socketio.emit('update_total', {'total': total})
     
     def show_receipt(self, items: List[Dict], total: float,
                      subtotal: float = 0.0, tax: float = 0.0,
@@ -156,13 +315,17 @@ class DisplayServer:
             timestamp: Formatted timestamp string (e.g., '02/25/2026 03:15 PM CST')
         """
         self.change_state('complete')
-        self.socketio.emit('show_receipt', {
+        # Build the payload once and keep it: reconnecting clients get the
+        # same dict re-emitted rather than rebuilt (Socket.IO handles the
+        # per-client serialization internally)
+        self._last_receipt = {
             'items': items,
             'subtotal': subtotal,
             'tax': tax,
             'total': total,
             'timestamp': timestamp
-        })
+        }
+        self.socketio.emit('show_receipt', self._last_receipt)
         logger.info(f"Receipt displayed: {len(items)} items, ${total:.2f} (tax: ${tax:.2f})")
     
     def show_error(self, error_message: str, error_code: Optional[str] = None) -> None:
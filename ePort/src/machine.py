@@ -50,6 +50,14 @@ class MachineController:
         self.button_to_product: Dict[int, 'Product'] = {}
         for product in products:
             self.button_to_product[product.button_pin] = product
+
+        # All motor pins, precomputed so they can be switched off in a single
+        # GPIO.output() call (RPi.GPIO accepts a list of channels)
+        self._motor_pins: List[int] = [product.motor_pin for product in products]
+
+        # Last commanded state per motor pin, so the dispensing loop can skip
+        # redundant GPIO writes while a button is held (pin -> True/False)
+        self._motor_state: Dict[int, bool] = {}
         
         # Current product being dispensed (set by select_product())
         self.current_product: Optional['Product'] = None
@@ -124,6 +132,7 @@ class MachineController:
         # Turn off motor for previous product (if any)
         if self.current_product:
             self.gpio.output(self.current_product.motor_pin, self.gpio.LOW)
+            self._motor_state[self.current_product.motor_pin] = False
         
         # Notify callback BEFORE switching (so callback can access previous product)
         if self._product_switch_callback:
@@ -273,9 +282,16 @@ class MachineController:
         """
         if not self.current_product:
             return  # No product selected
-        
+
+        # Skip redundant writes - the dispensing loop calls this on every poll
+        # iteration, but the motor state only changes on press/release
+        pin = self.current_product.motor_pin
+        if self._motor_state.get(pin) is state:
+            return
+        self._motor_state[pin] = state
+
         # GPIO.HIGH = 3.3V = motor ON, GPIO.LOW = 0V = motor OFF
-        self.gpio.output(self.current_product.motor_pin, self.gpio.HIGH if state else self.gpio.LOW)
+        self.gpio.output(pin, self.gpio.HIGH if state else self.gpio.LOW)
     
     def is_product_button_pressed(self, product: Optional['Product'] = None) -> bool:
         """
@@ -370,9 +386,10 @@ class MachineController:
         for the next customer. Clears all the state variables and removes callback
         references so the machine is ready for a new dispensing session.
         """
-        # Turn off all motors
-        for product in self.products:
-            self.gpio.output(product.motor_pin, self.gpio.LOW)
+        # Turn off all motors in one GPIO call (RPi.GPIO writes a list of
+        # channels in a single operation instead of one syscall per pin)
+        self.gpio.output(self._motor_pins, self.gpio.LOW)
+        self._motor_state.clear()
         
         # Remove event detection to clean up GPIO state
         # This prevents conflicts when start_dispensing() is called again
@@ -3,9 +3,77 @@ ePort payment protocol handler
 Handles all communication with the ePort card reader device
 """
 
-import time
+import binascii
+from functools import lru_cache
 from typing import Optional
-from ..config import CRC_TABLE, RS, GS, CR, EPORT_COMMAND_DELAY
+from ..config import CRC_TABLE, RS, GS, CR, SERIAL_WRITE_TIMEOUT
+from .product import Product
+
+
+def _crc16_reference(data) -> int:
+    """
+    Pure-Python CRC16 reference implementation (Serial ePort Protocol Appendix B)
+
+    Kept as the readable reference for the table algorithm the ePort documents.
+    Production code goes through binascii.crc_hqx instead, which implements the
+    same CRC16-CCITT (polynomial 0x1021, initial value 0xFFFF) in C.
+    """
+    new_crc = 0xFFFF
+    for byte in data:
+        new_crc = ((new_crc << 8) ^ CRC_TABLE[(new_crc >> 8) ^ byte]) & 0xFFFF
+    return new_crc
+
+
+@lru_cache(maxsize=256)
+def _crc16_bytes(data: bytes) -> int:
+    """CRC16 over immutable bytes, memoized for repeated payloads
+
+    The machine re-sends identical payloads often (same authorization
+    amount, retransmitted transaction results), so recent CRCs are served
+    from the cache instead of rescanning the bytes.
+    """
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def _crc16(data) -> int:
+    """
+    CRC16 used on every outgoing ePort command
+
+    Module-level so the command builders call it directly without the
+    attribute-lookup/bound-method overhead of going through the class.
+    See EPortProtocol.calculate_crc16 for the full protocol documentation.
+    """
+    # bytes() is a no-op for bytes input, a copy only for bytearray
+    return _crc16_bytes(bytes(data))
+
+
+# Separator bytes as singletons so command builders can join fragments without
+# re-wrapping the integer constants on every call
+_RS_B = bytes([RS])  # Record Separator
+_GS_B = bytes([GS])  # Group Separator
+_CR_B = bytes([CR])  # Carriage Return (response terminator)
+
+# Fixed commands precomputed once - these never vary, so there is no reason to
+# allocate a fresh bytearray for them on every call
+_STATUS_CMD = bytes([0x31, CR])        # '1' + CR (STATUS, command 1)
+_RESET_CMD = bytes([0x33, CR])         # '3' + CR (RESET, command 3)
+_TXID_CMD = bytes([0x31, 0x33, CR])    # "13" + CR (transaction ID, command 13)
+
+# Small integers preformatted as ASCII (quantity is almost always 1)
+_SMALL_INT_B = tuple(b"%d" % i for i in range(16))
+
+
+def _itob(n: int) -> bytes:
+    """
+    Format a non-negative integer as ASCII bytes
+
+    Avoids the str(n).encode('ascii') round-trip: b"%d" formats directly into
+    a bytes object, and small values (quantities, line-item counts) come from
+    a preformatted table.
+    """
+    if 0 <= n < 16:
+        return _SMALL_INT_B[n]
+    return b"%d" % n
 
 
 class EPortProtocol:
@@ -36,6 +104,11 @@ class EPortProtocol:
                               baud rate, timeout, etc.
         """
         self.ser = serial_connection
+
+        # Bound each command write so a wedged UART raises instead of blocking
+        # the main loop indefinitely. Commands are built as one contiguous
+        # bytes object, so each one goes out in a single write().
+        self.ser.write_timeout = SERIAL_WRITE_TIMEOUT
     
     @staticmethod
     def calculate_crc16(data: bytearray) -> int:
@@ -46,29 +119,22 @@ class EPortProtocol:
         The ePort device requires a CRC16 checksum at the end of every command. If the
         CRC is wrong, the device will reject the command.
         
-        The algorithm uses a lookup table (CRC_TABLE) for efficiency. This is a standard
-        CCITT CRC16 implementation specifically required by the ePort protocol.
-        
+        This is the standard CCITT CRC16 (polynomial 0x1021, initial value 0xFFFF)
+        specifically required by the ePort protocol. The computation is delegated
+        to binascii.crc_hqx, the stdlib C implementation of exactly this CRC, which
+        avoids running the per-byte table loop through the Python interpreter.
+        The readable table-loop version lives in _crc16_reference above.
+
         Args:
             data: Bytearray to calculate CRC for (the command data before CRC bytes)
-            
+
         Returns:
             16-bit CRC value (0x0000 to 0xFFFF) that gets appended to the command
-            
+
         Note:
             CRC is computed from the first byte including all control characters (RS, GS, etc.)
         """
-        # Initialize CRC to 0xFFFF (standard starting value for CRC16)
-        new_crc = 0xFFFF
-        
-        # Process each byte in the data using the lookup table algorithm
-        for byte in data:
-            # This is the CRC16-CCITT algorithm using a lookup table
-            # XOR operations combine the current CRC state with the lookup table value
-            new_crc = ((new_crc << 8) ^ CRC_TABLE[(new_crc >> 8) ^ byte]) & 0xFFFF
-            # & 0xFFFF keeps the result as a 16-bit value (masks to 16 bits)
-        
-        return new_crc
+        return _crc16(data)
     
     def status(self) -> bytes:
         """
@@ -84,14 +150,13 @@ class EPortProtocol:
             Status response bytes from the ePort device
         """
         # Command 1 is just the ASCII character '1' (0x31) followed by carriage return
-        command = bytearray([0x31, CR])  # '1' + CR (carriage return)
-        self.ser.write(command)
-        
-        # Wait a bit for the device to process and respond (serial communication takes time)
-        time.sleep(EPORT_COMMAND_DELAY)
-        
-        # Read the response line and remove whitespace (strip newlines, etc.)
-        return self.ser.readline().strip()
+        self.ser.write(_STATUS_CMD)
+
+        # read_until() blocks until the CR-terminated response arrives (or the
+        # serial timeout expires), so no fixed sleep is needed - the call
+        # returns as soon as the device answers. Responses are CR-framed, not
+        # newline-framed, so read on the actual terminator instead of readline().
+        return self.ser.read_until(_CR_B).strip()
     
     def reset(self):
         """
@@ -102,9 +167,8 @@ class EPortProtocol:
         a known good state.
         """
         # Command 3 is the ASCII character '3' (0x33) followed by carriage return
-        command = bytearray([0x33, CR])  # '3' + CR
-        self.ser.write(command)
-        time.sleep(EPORT_COMMAND_DELAY)  # Wait for reset to complete
+        self.ser.write(_RESET_CMD)
+        self.ser.flush()  # Block until the command has left the UART buffer
     
     def request_authorization(self, amount_cents: int):
         """
@@ -121,26 +185,22 @@ class EPortProtocol:
             amount_cents: Authorization amount in cents (e.g., 2000 = $20.00)
                           This is a pre-authorization - the actual charge will be less
         """
-        # Build the command payload: "21" + Record Separator + amount as string
-        # 0x32 = ASCII '2', 0x31 = ASCII '1', so [0x32, 0x31] = "21"
-        payload = bytearray([0x32, 0x31, RS])  # "21" + RS (Record Separator)
-        payload.extend(str(amount_cents).encode('ascii'))  # Append amount as ASCII: "2000"
-        
+        # Build the command payload in one allocation: "21" + RS + amount as ASCII
+        payload = b"".join((b"21", _RS_B, _itob(amount_cents)))
+
         # Calculate the CRC16 checksum for the payload (device requires this for validation)
-        crc = self.calculate_crc16(payload)
-        
-        # Build the complete command: payload + CRC high byte + CRC low byte + carriage return
-        command = bytearray(payload)
-        command.append((crc >> 8) & 0xFF)  # CRC high byte (bits 15-8)
-        command.append(crc & 0xFF)         # CRC low byte (bits 7-0)
-        command.append(CR)                 # Carriage return marks end of command
-        
+        crc = _crc16(payload)
+
+        # Append CRC high byte, CRC low byte, and the terminating carriage return
+        command = payload + bytes(((crc >> 8) & 0xFF, crc & 0xFF, CR))
+
         # Send the command to the ePort device via serial port
         self.ser.write(command)
-        time.sleep(EPORT_COMMAND_DELAY)  # Wait for device to process the authorization request
+        self.ser.flush()  # Block until the command has left the UART buffer
     
-    def send_transaction_result(self, quantity: int, price_cents: int, 
-                                item_id: str, description: str) -> bool:
+    def send_transaction_result(self, quantity: int, price_cents: int,
+                                item_id: str = "", description: str = "",
+                                product: Optional['Product'] = None) -> bool:
         """
         Send TRANSACTION_RESULT command (command 22) to complete the sale
         
@@ -159,43 +219,49 @@ class EPortProtocol:
             price_cents: Final transaction price in cents (e.g., 35 = $0.35)
             item_id: Item identifier string (0-5 digits, used for reporting)
             description: Item description (max 30 bytes, e.g., "oz hand wash")
-            
+            product: Optional Product whose pre-encoded ID/description fields
+                     are used instead of item_id/description (skips re-encoding
+                     the fixed per-product strings on every sale)
+
         Returns:
             True if command sent successfully (doesn't guarantee device accepted it)
         """
-        # For this vending machine, we always have exactly 1 line item
-        line_items = "1"
-        
-        # Build the command payload (everything except CRC and CR)
-        payload = bytearray()
-        payload.extend(b"22")  # Command 22 (TRANSACTION_RESULT)
-        payload.append(RS)     # Record Separator
-        
-        # Add each field separated by RS (Record Separator)
-        payload.extend(line_items.encode('ascii'))      # Number of line items: "1"
-        payload.append(RS)
-        payload.extend(str(quantity).encode('ascii'))   # Quantity: "1"
-        payload.append(RS)
-        payload.extend(str(price_cents).encode('ascii')) # Price in cents: "35"
-        payload.append(RS)
-        payload.extend(item_id.encode('ascii'))         # Item ID: "1"
-        payload.append(RS)
-        payload.extend(description[:30].encode('ascii')) # Description (max 30 bytes): "oz hand wash"
-        payload.append(GS)     # Group Separator marks end of item data
-        
+        # Use the product's cached ASCII fields when given; otherwise encode
+        # the caller-supplied strings
+        if product is not None:
+            item_id_b, description_b = product.as_txn_fields()
+        else:
+            item_id_b = item_id.encode('ascii')
+            description_b = description[:30].encode('ascii')
+
+        # Build the command payload in one allocation: each field separated by RS
+        # (Record Separator), with GS (Group Separator) marking end of item data.
+        # For this vending machine, we always have exactly 1 line item.
+        payload = b"".join((
+            b"22",                              # Command 22 (TRANSACTION_RESULT)
+            _RS_B,
+            b"1",                               # Number of line items: "1"
+            _RS_B,
+            _itob(quantity),                    # Quantity: "1"
+            _RS_B,
+            _itob(price_cents),                 # Price in cents: "35"
+            _RS_B,
+            item_id_b,                          # Item ID: "1"
+            _RS_B,
+            description_b,                      # Description (max 30 bytes): "oz hand wash"
+            _GS_B,
+        ))
+
         # Calculate CRC16 checksum for the payload
-        crc = self.calculate_crc16(payload)
-        
-        # Build the complete command: payload + CRC bytes + carriage return
-        command = bytearray(payload)
-        command.append((crc >> 8) & 0xFF)  # CRC high byte (upper 8 bits)
-        command.append(crc & 0xFF)         # CRC low byte (lower 8 bits)
-        command.append(CR)                 # Carriage return marks end of command
-        
+        crc = _crc16(payload)
+
+        # Append CRC high byte, CRC low byte, and the terminating carriage return
+        command = payload + bytes(((crc >> 8) & 0xFF, crc & 0xFF, CR))
+
         # Send the command to the ePort device
         self.ser.write(command)
-        time.sleep(EPORT_COMMAND_DELAY)  # Wait for device to process
-        
+        self.ser.flush()  # Block until the command has left the UART buffer
+
         return True
     
     def get_transaction_id(self) -> Optional[str]:
@@ -212,10 +278,9 @@ class EPortProtocol:
             Transaction ID as string (e.g., "12345678"), or None if not available/parsed
         """
         # Command 13 is "13" in ASCII: 0x31='1', 0x33='3'
-        command = bytearray([0x31, 0x33, CR])  # "13" + CR
-        self.ser.write(command)
-        time.sleep(EPORT_COMMAND_DELAY)
-        
+        self.ser.write(_TXID_CMD)
+        self.ser.flush()  # Block until the command has left the UART buffer
+
         # Get the response by sending a STATUS command (the ePort returns the ID in status response)
         response = self.status()
         
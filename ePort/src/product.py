@@ -13,7 +13,16 @@ class Product:
     Stores all configuration needed to dispense a product including
     pricing, GPIO pins, and flowmeter calibration.
     """
-    
+
+    # Fixed attribute layout: products are touched on every button press and
+    # flowmeter pulse, so skip the per-instance __dict__ (smaller instances,
+    # faster attribute access)
+    __slots__ = (
+        'id', 'name', 'price_per_unit', 'unit', 'motor_pin',
+        'flowmeter_pin', 'button_pin', 'pulses_per_unit', 'description',
+        '_id_ascii', '_desc_ascii'
+    )
+
     def __init__(
         self,
         product_id: str,
@@ -52,6 +61,13 @@ class Product:
         
         # Validate configuration
         self._validate()
+
+        # ePort wire fields, pre-encoded once (ID and description are fixed per
+        # product, so the transaction path should not re-encode them per sale).
+        # The ePort serial protocol is ASCII-only with a 30-byte description limit.
+        self._id_ascii = self.id.encode('ascii', errors='ignore')
+        self._desc_ascii = (self.description or self.name).encode(
+            'ascii', errors='ignore')[:30]
     
     def _validate(self):
         """Validate product configuration"""
@@ -67,15 +83,14 @@ class Product:
         if not self.unit:
             raise ValueError(f"Product {self.id}: unit cannot be empty")
         
-        if self.motor_pin < 0:
-            raise ValueError(f"Product {self.id}: motor_pin must be non-negative")
-        
-        if self.flowmeter_pin < 0:
-            raise ValueError(f"Product {self.id}: flowmeter_pin must be non-negative")
-        
-        if self.button_pin < 0:
-            raise ValueError(f"Product {self.id}: button_pin must be non-negative")
-        
+        # All three GPIO pins share the same constraint - one min() comparison
+        # on the happy path, with the per-pin message built only on failure
+        pins = (self.motor_pin, self.flowmeter_pin, self.button_pin)
+        if min(pins) < 0:
+            names = ('motor_pin', 'flowmeter_pin', 'button_pin')
+            bad = next(name for name, pin in zip(names, pins) if pin < 0)
+            raise ValueError(f"Product {self.id}: {bad} must be non-negative")
+
         if self.pulses_per_unit <= 0:
             raise ValueError(f"Product {self.id}: pulses_per_unit must be positive")
     
@@ -90,6 +105,17 @@ class Product:
             Price in dollars (rounded to 2 decimal places)
         """
         return round(quantity * self.price_per_unit, 2)
+
+    def as_txn_fields(self) -> tuple:
+        """
+        Get the pre-encoded (item_id, description) bytes for an ePort
+        TRANSACTION_RESULT command
+
+        Returns:
+            Tuple of (item_id_bytes, description_bytes), both ASCII,
+            description capped at the ePort 30-byte limit
+        """
+        return self._id_ascii, self._desc_ascii
     
     def __repr__(self) -> str:
         """String representation for debugging"""
@@ -5,12 +5,58 @@ Loads and manages product configurations from JSON file
 
 import json
 import logging
+import os
+from functools import lru_cache
 from typing import List, Optional, Dict
 from .product import Product
 
+# Use orjson's C parser when available (optional - not in requirements.txt);
+# fall back to the stdlib. Both raise ValueError subclasses on malformed JSON.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Read and parse a JSON config file, memoized per on-disk version
+
+    Keyed by (path, mtime_ns, size): rewriting the file changes the key, so
+    the cache misses cleanly, while repeated loads of an unchanged file (the
+    common case in tests, which construct many ProductManagers over the same
+    config) skip the read and parse entirely. Callers must treat the returned
+    dict as read-only - ProductManager only iterates it to build fresh
+    Product instances, so loads stay independent.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _find_first_duplicate(products: List[Product], attr: str) -> Optional[Product]:
+    """
+    Find the first product whose attribute value repeats an earlier product's
+
+    Args:
+        products: Products in load order
+        attr: Attribute name to check for uniqueness (e.g., 'motor_pin')
+
+    Returns:
+        The offending Product, or None if all values are unique
+    """
+    seen = set()
+    for product in products:
+        value = getattr(product, attr)
+        if value in seen:
+            return product
+        seen.add(value)
+    return None
+
+
 class ProductManager:
     """
     Manages product configurations and provides product lookup
@@ -22,14 +68,74 @@ class ProductManager:
     def __init__(self, config_path: str):
         """
         Initialize product manager
-        
+
         Args:
             config_path: Path to products.json configuration file
         """
         self.config_path = config_path
+        self._init_catalog()
+        self.load_products()
+
+    def _init_catalog(self) -> None:
+        """Initialize the empty catalog structures"""
         self.products: Dict[str, Product] = {}
         self._button_pin_map: Dict[int, Product] = {}
-        self.load_products()
+
+        # Structure-of-arrays view of the catalog: one tuple per field, indexed
+        # by load order, so bulk operations (UI product lists, calibration
+        # sweeps) can read a single field across all products without touching
+        # N Product objects
+        self.product_ids: tuple = ()
+        self.motor_pins: tuple = ()
+        self.flowmeter_pins: tuple = ()
+        self.button_pins: tuple = ()
+        self.prices_per_unit: tuple = ()
+        self.pulses_per_unit: tuple = ()
+        self._button_pin_index: Dict[int, int] = {}
+
+    @classmethod
+    def from_dict(cls, config: dict) -> 'ProductManager':
+        """
+        Build a product manager from an already-parsed config dict
+
+        Skips the filesystem entirely - useful for tests and for callers that
+        get their configuration from somewhere other than products.json.
+
+        Args:
+            config: Parsed configuration (same shape as products.json,
+                    i.e. {"products": [...]})
+
+        Returns:
+            ProductManager with the catalog loaded and validated
+
+        Raises:
+            ValueError: If config is invalid or has duplicate pins
+        """
+        manager = cls.__new__(cls)
+        manager.config_path = None
+        manager._init_catalog()
+        manager._load_config(config)
+        return manager
+
+    @classmethod
+    def from_stream(cls, fp) -> 'ProductManager':
+        """
+        Build a product manager from a file-like object containing JSON
+
+        Args:
+            fp: File-like object (e.g. io.StringIO) yielding the config JSON
+
+        Returns:
+            ProductManager with the catalog loaded and validated
+
+        Raises:
+            ValueError: If the JSON is malformed, or config is invalid
+        """
+        try:
+            config = _json_loads(fp.read())
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON in products config: {e}")
+        return cls.from_dict(config)
     
     def load_products(self) -> None:
         """
@@ -43,15 +149,32 @@ class ProductManager:
         logger.info(f"Loading products from {self.config_path}")
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            stat = os.stat(self.config_path)
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Products config file not found: {self.config_path}"
             )
-        except json.JSONDecodeError as e:
+
+        try:
+            # Memoized per on-disk version (path, mtime, size) - a reload of
+            # an unchanged file costs a stat, not a read and parse
+            config = _parse_config(self.config_path, stat.st_mtime_ns, stat.st_size)
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             raise ValueError(f"Invalid JSON in products config: {e}")
-        
+
+        self._load_config(config)
+
+    def _load_config(self, config: dict) -> None:
+        """
+        Validate a parsed config and build the catalog structures
+
+        Args:
+            config: Parsed configuration dict
+
+        Raises:
+            ValueError: If config is invalid or has duplicate pins
+        """
         if 'products' not in config:
             raise ValueError("Products config must have 'products' key")
         
@@ -61,16 +184,8 @@ class ProductManager:
         if len(config['products']) == 0:
             raise ValueError("At least one product must be configured")
         
-        # Clear existing products
-        self.products.clear()
-        self._button_pin_map.clear()
-        
-        # Track pins to detect duplicates
-        used_motor_pins = set()
-        used_flowmeter_pins = set()
-        used_button_pins = set()
-        
-        # Load each product
+        # Construct all products first; uniqueness is validated in one pass below
+        products = []
         for product_data in config['products']:
             try:
                 product = Product(
@@ -84,41 +199,6 @@ class ProductManager:
                     pulses_per_unit=product_data['pulses_per_unit'],
                     description=product_data.get('description', '')
                 )
-                
-                # Check for duplicate product ID
-                if product.id in self.products:
-                    raise ValueError(f"Duplicate product ID: {product.id}")
-                
-                # Check for duplicate GPIO pins
-                if product.motor_pin in used_motor_pins:
-                    raise ValueError(
-                        f"Product {product.id}: motor_pin {product.motor_pin} "
-                        f"already used by another product"
-                    )
-                
-                if product.flowmeter_pin in used_flowmeter_pins:
-                    raise ValueError(
-                        f"Product {product.id}: flowmeter_pin {product.flowmeter_pin} "
-                        f"already used by another product"
-                    )
-                
-                if product.button_pin in used_button_pins:
-                    raise ValueError(
-                        f"Product {product.id}: button_pin {product.button_pin} "
-                        f"already used by another product"
-                    )
-                
-                # Add to collections
-                self.products[product.id] = product
-                self._button_pin_map[product.button_pin] = product
-                
-                # Track used pins
-                used_motor_pins.add(product.motor_pin)
-                used_flowmeter_pins.add(product.flowmeter_pin)
-                used_button_pins.add(product.button_pin)
-                
-                logger.info(f"Loaded product: {product}")
-                
             except KeyError as e:
                 raise ValueError(
                     f"Product missing required field: {e}"
@@ -127,7 +207,37 @@ class ProductManager:
                 raise ValueError(
                     f"Invalid product configuration: {e}"
                 )
-        
+
+            products.append(product)
+            logger.info(f"Loaded product: {product}")
+
+        # Check for duplicate product ID
+        duplicate = _find_first_duplicate(products, 'id')
+        if duplicate is not None:
+            raise ValueError(f"Duplicate product ID: {duplicate.id}")
+
+        # Check for duplicate GPIO pins
+        for pin_attr in ('motor_pin', 'flowmeter_pin', 'button_pin'):
+            duplicate = _find_first_duplicate(products, pin_attr)
+            if duplicate is not None:
+                raise ValueError(
+                    f"Product {duplicate.id}: {pin_attr} {getattr(duplicate, pin_attr)} "
+                    f"already used by another product"
+                )
+
+        # Build lookup maps in one pass each (validation above guarantees uniqueness)
+        self.products = {product.id: product for product in products}
+        self._button_pin_map = {product.button_pin: product for product in products}
+
+        # Parallel per-field tuples (see __init__), all indexed by load order
+        self.product_ids = tuple(product.id for product in products)
+        self.motor_pins = tuple(product.motor_pin for product in products)
+        self.flowmeter_pins = tuple(product.flowmeter_pin for product in products)
+        self.button_pins = tuple(product.button_pin for product in products)
+        self.prices_per_unit = tuple(product.price_per_unit for product in products)
+        self.pulses_per_unit = tuple(product.pulses_per_unit for product in products)
+        self._button_pin_index = {product.button_pin: i for i, product in enumerate(products)}
+
         logger.info(f"Successfully loaded {len(self.products)} products")
     
     def get_product(self, product_id: str) -> Product:
@@ -158,6 +268,22 @@ class ProductManager:
             Product object if found, None otherwise
         """
         return self._button_pin_map.get(pin)
+
+    def get_idx_by_button_pin(self, pin: int) -> Optional[int]:
+        """
+        Get a product's load-order index by its button GPIO pin
+
+        The index addresses the parallel field tuples (motor_pins, button_pins,
+        prices_per_unit, ...), letting hot paths read individual fields without
+        going through a Product object.
+
+        Args:
+            pin: GPIO pin number
+
+        Returns:
+            Index into the field tuples if found, None otherwise
+        """
+        return self._button_pin_index.get(pin)
     
     def list_products(self) -> List[Product]:
         """
@@ -7,6 +7,40 @@ from typing import List, Dict
 from datetime import datetime
 
 
+class TransactionItem:
+    """
+    Single dispensed item within a transaction
+
+    A fixed-slot record instead of a per-item dict: the summary methods read
+    fields by attribute offset with no key hashing, and each record is a
+    fraction of a dict's size.
+    """
+
+    __slots__ = ('product_id', 'product_name', 'quantity', 'unit', 'price',
+                 'first_token')
+
+    def __init__(self, product_id: str, product_name: str,
+                 quantity: float, unit: str, price: float):
+        self.product_id = product_id
+        self.product_name = product_name
+        self.quantity = quantity
+        self.unit = unit
+        self.price = price
+        # First word of the name, computed once for the ePort description
+        # (partition reuses the existing string, no list allocation)
+        self.first_token = product_name.partition(' ')[0]
+
+    def to_dict(self) -> Dict:
+        """Dict form for display/receipt consumers that expect item dicts"""
+        return {
+            "product_id": self.product_id,
+            "product_name": self.product_name,
+            "quantity": self.quantity,
+            "unit": self.unit,
+            "price": self.price
+        }
+
+
 class TransactionTracker:
     """
     Tracks items dispensed in a single transaction
@@ -17,9 +51,19 @@ class TransactionTracker:
     
     def __init__(self):
         """Initialize empty transaction"""
-        self.items: List[Dict] = []
-        self.total: float = 0.0
+        self.items: List[TransactionItem] = []
+        # Running total in integer cents: adding an item is a plain int add,
+        # and no binary-float rounding error can accumulate across items
+        self.total_cents: int = 0
         self.start_time = datetime.now()
+
+        # Cheap memoization for the summary accessors: the ePort polling loop
+        # calls them repeatedly between dispenses, but their output only
+        # changes when an item is added or the transaction resets. The version
+        # counter is bumped on every mutation; cached values are stored as
+        # (version, result) and reused while the version matches.
+        self._version: int = 0
+        self._cache: Dict[str, tuple] = {}
     
     def add_item(self, product_id: str, product_name: str, 
                  quantity: float, unit: str, price: float) -> None:
@@ -33,16 +77,15 @@ class TransactionTracker:
             unit: Unit type (oz, ml, etc.)
             price: Price for this item in dollars
         """
-        item = {
-            "product_id": product_id,
-            "product_name": product_name,
-            "quantity": round(quantity, 2),
-            "unit": unit,
-            "price": round(price, 2)
-        }
-        
-        self.items.append(item)
-        self.total = round(self.total + price, 2)
+        self.items.append(TransactionItem(
+            product_id=product_id,
+            product_name=product_name,
+            quantity=round(quantity, 2),
+            unit=unit,
+            price=round(price, 2)
+        ))
+        self.total_cents += int(round(price * 100))
+        self._version += 1
     
     def get_total(self) -> float:
         """
@@ -51,25 +94,31 @@ class TransactionTracker:
         Returns:
             Total price (rounded to 2 decimal places)
         """
-        return round(self.total, 2)
-    
+        return self.total_cents / 100.0
+
     def get_total_cents(self) -> int:
         """
         Get total transaction price in cents
-        
+
         Returns:
             Total price in cents (for ePort protocol)
         """
-        return int(round(self.total * 100))
+        return self.total_cents
     
     def get_items(self) -> List[Dict]:
         """
         Get list of items in transaction
-        
+
         Returns:
             List of item dictionaries
         """
-        return self.items.copy()
+        cached = self._cache.get('items')
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        items = [item.to_dict() for item in self.items]
+        self._cache['items'] = (self._version, items)
+        return items
     
     def get_item_count(self) -> int:
         """Get number of items in transaction"""
@@ -88,18 +137,18 @@ class TransactionTracker:
         """
         totals = {}
         for item in self.items:
-            product_id = item['product_id']
+            product_id = item.product_id
             if product_id in totals:
                 # Accumulate quantity and price for this product
-                totals[product_id]['quantity'] += item['quantity']
-                totals[product_id]['price'] += item['price']
+                totals[product_id]['quantity'] += item.quantity
+                totals[product_id]['price'] += item.price
             else:
                 # First time seeing this product
                 totals[product_id] = {
-                    'product_name': item['product_name'],
-                    'quantity': item['quantity'],
-                    'unit': item['unit'],
-                    'price': item['price']
+                    'product_name': item.product_name,
+                    'quantity': item.quantity,
+                    'unit': item.unit,
+                    'price': item.price
                 }
         
         # Round accumulated values
@@ -116,25 +165,37 @@ class TransactionTracker:
         Returns:
             Multi-line string with itemized list and total
         """
-        if self.is_empty():
-            return "No items dispensed"
-        
-        lines = []
-        lines.append("TRANSACTION SUMMARY")
-        lines.append("-" * 40)
-        
+        cached = self._cache.get('summary')
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        # Inline emptiness check - no method call on the common path
+        if not self.items:
+            summary = "No items dispensed"
+        else:
+            # Feed the lines straight into join - no append/resize churn on
+            # an intermediate list
+            summary = "\n".join(self._summary_lines())
+
+        self._cache['summary'] = (self._version, summary)
+        return summary
+
+    def _summary_lines(self):
+        """Yield the summary lines: header, items, separator, total"""
+        separator = "-" * 40
+        yield "TRANSACTION SUMMARY"
+        yield separator
+
         for item in self.items:
             # Format: "Hand Soap: 2.50 oz - $0.38"
-            lines.append(
-                f"{item['product_name']}: "
-                f"{item['quantity']:.2f} {item['unit']} - "
-                f"${item['price']:.2f}"
+            yield (
+                f"{item.product_name}: "
+                f"{item.quantity:.2f} {item.unit} - "
+                f"${item.price:.2f}"
             )
-        
-        lines.append("-" * 40)
-        lines.append(f"TOTAL: ${self.total:.2f}")
-        
-        return "\n".join(lines)
+
+        yield separator
+        yield f"TOTAL: ${self.total_cents / 100:.2f}"
     
     def get_compact_summary(self) -> str:
         """
@@ -143,12 +204,19 @@ class TransactionTracker:
         Returns:
             Single-line summary (e.g., "3 items, $0.76")
         """
-        if self.is_empty():
-            return "Empty transaction"
-        
+        cached = self._cache.get('compact_summary')
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
         item_count = len(self.items)
-        item_word = "item" if item_count == 1 else "items"
-        return f"{item_count} {item_word}, ${self.total:.2f}"
+        if item_count == 0:
+            summary = "Empty transaction"
+        else:
+            item_word = "item" if item_count == 1 else "items"
+            summary = f"{item_count} {item_word}, ${self.total_cents / 100:.2f}"
+
+        self._cache['compact_summary'] = (self._version, summary)
+        return summary
     
     def get_eport_description(self) -> str:
         """
@@ -157,35 +225,42 @@ class TransactionTracker:
         Returns:
             Truncated description for ePort protocol
         """
-        if self.is_empty():
-            return "No items"
-        
-        if len(self.items) == 1:
+        cached = self._cache.get('eport_description')
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        item_count = len(self.items)
+        if item_count == 0:
+            desc = "No items"
+        elif item_count == 1:
             # Single item: "2.50 oz hand soap"
             item = self.items[0]
-            desc = f"{item['quantity']:.2f} {item['unit']} {item['product_name'].lower()}"
+            desc = f"{item.quantity:.2f} {item.unit} {item.product_name.lower()}"
         else:
             # Multiple items: "3 items: soap, detergent"
-            product_names = [item['product_name'].split()[0] for item in self.items]
+            product_names = [item.first_token for item in self.items]
             products_str = ", ".join(product_names[:2])  # First 2 products
-            if len(self.items) > 2:
+            if item_count > 2:
                 products_str += "..."
-            desc = f"{len(self.items)} items: {products_str}"
-        
-        # Strip non-ASCII chars (ePort serial protocol is ASCII-only)
-        desc = desc.encode('ascii', errors='ignore').decode('ascii')
-        # Truncate to 30 bytes (ePort limit)
-        return desc[:30]
+            desc = f"{item_count} items: {products_str}"
+
+        # Strip non-ASCII chars (ePort serial protocol is ASCII-only) and
+        # truncate to 30 bytes (ePort limit)
+        desc = desc.encode('ascii', errors='ignore').decode('ascii')[:30]
+
+        self._cache['eport_description'] = (self._version, desc)
+        return desc
     
     def reset(self) -> None:
         """Reset transaction for next customer"""
         self.items.clear()
-        self.total = 0.0
+        self.total_cents = 0
         self.start_time = datetime.now()
+        self._version += 1
     
     def __repr__(self) -> str:
         """String representation for debugging"""
-        return f"TransactionTracker({len(self.items)} items, ${self.total:.2f})"
+        return f"TransactionTracker({len(self.items)} items, ${self.total_cents / 100:.2f})"
     
     def __str__(self) -> str:
         """Human-readable string"""
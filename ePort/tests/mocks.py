@@ -3,6 +3,7 @@ Mock classes for testing without hardware
 """
 
 import time
+from collections import deque
 from typing import Optional
 
 
@@ -38,8 +39,12 @@ class MockGPIO:
         return self.pins.get(pin, self.HIGH)
     
     def output(self, pin, value):
-        """Write GPIO pin"""
-        self.pins[pin] = value
+        """Write GPIO pin (accepts a single pin or a list of pins, like RPi.GPIO)"""
+        if isinstance(pin, (list, tuple)):
+            for p in pin:
+                self.pins[p] = value
+        else:
+            self.pins[pin] = value
     
     def add_event_detect(self, pin, edge, callback=None, bouncetime=None):
         """Add event detection (stored but not actually triggered)"""
@@ -72,13 +77,27 @@ class MockSerial:
         self.baudrate = baudrate
         self.timeout = timeout
         self.write_buffer = bytearray()
-        self.read_buffer = bytearray()
+        # Read side: complete CR-terminated frames ready to hand out (O(1)
+        # popleft per read), plus any trailing bytes not yet terminated
+        self._lines: deque = deque()
+        self._partial = bytearray()
+        self.reset_mock()
+
+    def reset_mock(self):
+        """Reset buffers and canned responses to the freshly-constructed state
+
+        Lets tests share one MockSerial across cases (setUpClass) and start
+        each case clean instead of building a new instance every time.
+        """
+        self.write_buffer.clear()
+        self._lines.clear()
+        self._partial.clear()
         self.responses = {
             b'1\r': b'0\r',  # STATUS -> OK (idle)
             b'3\r': b'\x06',  # RESET -> ACK
         }
         self._simulate_disabled_state()
-    
+
     def _simulate_disabled_state(self):
         """Simulate ePort in disabled state"""
         self.responses[b'1\r'] = b'6\r'  # STATUS -> DISABLED
@@ -105,23 +124,52 @@ class MockSerial:
         """Simulate ePort waiting for transaction result"""
         self.responses[b'1\r'] = b'9\r'  # STATUS -> XPCTNG_TRANS_RESULT
     
+    def queue_response(self, data: bytes):
+        """
+        Queue device response bytes for reading
+
+        Complete CR-terminated frames go onto the line deque; any trailing
+        unterminated bytes wait in the partial buffer until their CR arrives.
+        """
+        self._partial.extend(data)
+        while True:
+            idx = self._partial.find(b'\r')
+            if idx < 0:
+                break
+            self._lines.append(bytes(self._partial[:idx + 1]))
+            del self._partial[:idx + 1]
+
     def write(self, data: bytearray):
         """Write data to serial port (stored in buffer)"""
         self.write_buffer.extend(data)
-        
-        # Simulate responses for known commands (convert bytearray to bytes for comparison)
-        data_bytes = bytes(data)
-        if data_bytes in self.responses:
-            self.read_buffer.extend(self.responses[data_bytes])
-    
+
+        # Simulate responses for known commands. Response keys are short
+        # ('1\r', '3\r', ...), so anything longer than the longest key can't
+        # match - skip the bytes() copy for long commands like AUTH_REQ and
+        # TRANSACTION_RESULT entirely.
+        if len(data) <= max(map(len, self.responses), default=0):
+            data_bytes = bytes(data)
+            if data_bytes in self.responses:
+                self.queue_response(self.responses[data_bytes])
+
     def readline(self) -> bytes:
         """Read a line from serial port"""
-        if b'\r' in self.read_buffer:
-            idx = self.read_buffer.index(b'\r') + 1
-            line = bytes(self.read_buffer[:idx])
-            self.read_buffer = self.read_buffer[idx:]
-            return line
-        return b''
+        return self.read_until(b'\r')
+
+    def read_until(self, expected: bytes = b'\n', size=None) -> bytes:
+        """Read until the expected terminator is found (pyserial-compatible)"""
+        if expected == b'\r':
+            # Frames are pre-split on CR - one O(1) pop per read
+            return self._lines.popleft() if self._lines else b''
+
+        # Generic terminator: search the pending byte stream
+        pending = b''.join(self._lines) + bytes(self._partial)
+        idx = pending.find(expected)
+        if idx < 0:
+            return b''
+        self._lines.clear()
+        self._partial = bytearray(pending[idx + len(expected):])
+        return pending[:idx + len(expected)]
     
     def flush(self):
         """Flush buffers"""
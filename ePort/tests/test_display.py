@@ -10,6 +10,7 @@ Usage:
 Manual mode: Use LEFT/RIGHT arrow keys to navigate between states
 """
 
+import asyncio
 import time
 import sys
 from ePort.src.display_server import DisplayServer
@@ -25,113 +26,113 @@ except ImportError:
 # Global display server instance
 display = None
 
-def run_demo():
-    """Run demo sequence"""
+# Dispensing demo script: (product_id, product_name, steps, qty_step,
+# price_per_unit). run_demo derives the live updates, final quantities,
+# and receipt from this one table.
+DISPENSE_PLAN = [
+    ('soap_hand', 'Hand Soap', 7, 1.2, 0.15),
+    ('soap_dish', 'Dish Soap', 5, 1.5, 0.12),
+    ('soap_laundry', 'Laundry', 4, 2.0, 0.10),
+]
+
+def dispense_schedule(steps, qty_step, price_per_unit):
+    """
+    Precompute the (quantity, price) pairs for a simulated dispense
+
+    The demo loop then just walks the list and pushes display updates,
+    instead of redoing the float math on every tick.
+
+    Returns:
+        List of (quantity, price) tuples for steps 1..steps
+    """
+    return [
+        (i * qty_step, i * qty_step * price_per_unit)
+        for i in range(1, steps + 1)
+    ]
+
+async def run_demo():
+    """
+    Run demo sequence
+
+    Async so the waits between states are awaits on the event loop rather
+    than blocking time.sleep calls: the display server's background thread
+    drains WebSocket traffic during them, and Ctrl+C interrupts promptly
+    instead of waiting out the current sleep.
+    """
     print("1. Idle state (swipe card)")
     display.change_state('idle')
-    time.sleep(2)
+    await asyncio.sleep(2)
     
     print("2. Authorizing payment...")
     display.change_state('authorizing')
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     print("3. Ready - product selection")
     display.change_state('ready')
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     print("4. Dispensing - live counters")
     display.change_state('dispensing')
-    time.sleep(1)
-    
-    # Simulate dispensing hand soap
-    print("   Dispensing Hand Soap...")
-    for i in range(1, 8):
-        qty = i * 1.2
-        price = qty * 0.15
-        display.update_product(
-            product_id='soap_hand',
-            product_name='Hand Soap',
-            quantity=qty,
-            unit='oz',
-            price=price,
-            is_active=True
-        )
-        display.update_total(price)
-        time.sleep(0.5)
+    await asyncio.sleep(1)
     
-    # Switch to dish soap
-    print("   Switching to Dish Soap...")
-    display.update_product(
-        product_id='soap_hand',
-        product_name='Hand Soap',
-        quantity=8.4,
-        unit='oz',
-        price=1.26,
-        is_active=False
-    )
-    
-    for i in range(1, 6):
-        qty = i * 1.5
-        price = qty * 0.12
-        display.update_product(
-            product_id='soap_dish',
-            product_name='Dish Soap',
-            quantity=qty,
-            unit='oz',
-            price=price,
-            is_active=True
-        )
-        display.update_total(1.26 + price)
-        time.sleep(0.5)
-    
-    print("   Switching to Laundry...")
-    display.update_product(
-        product_id='soap_dish',
-        product_name='Dish Soap',
-        quantity=7.5,
-        unit='oz',
-        price=0.90,
-        is_active=False
-    )
-    
-    for i in range(1, 5):
-        qty = i * 2.0
-        price = qty * 0.10
+    # Walk the dispense plan: one generic loop instead of three hand-copied
+    # ones, with final quantities, receipt lines, and the grand total all
+    # derived from the same data
+    total_so_far = 0.0
+    receipt_items = []
+    for i, (product_id, product_name, steps, qty_step, price_per_unit) in enumerate(DISPENSE_PLAN):
+        verb = "Dispensing" if i == 0 else "Switching to"
+        print(f"   {verb} {product_name}...")
+
+        for qty, price in dispense_schedule(steps, qty_step, price_per_unit):
+            display.update_product_and_total(
+                product_id=product_id,
+                product_name=product_name,
+                quantity=qty,
+                unit='oz',
+                price=price,
+                total=total_so_far + price,
+                is_active=True
+            )
+            await asyncio.sleep(0.5)
+
+        # Final values for this product: drop the active highlight and fold
+        # its price into the running total
+        final_qty = steps * qty_step
+        final_price = final_qty * price_per_unit
         display.update_product(
-            product_id='soap_laundry',
-            product_name='Laundry',
-            quantity=qty,
+            product_id=product_id,
+            product_name=product_name,
+            quantity=final_qty,
             unit='oz',
-            price=price,
-            is_active=True
+            price=final_price,
+            is_active=False
         )
-        display.update_total(1.26 + 0.90 + price)
-        time.sleep(0.5)
-    
-    time.sleep(1)
+        total_so_far += final_price
+        receipt_items.append({
+            'product_name': product_name,
+            'quantity': final_qty,
+            'unit': 'oz',
+            'price': final_price
+        })
+
+    await asyncio.sleep(1)
     
     print("5. Waiting - press done button")
     display.change_state('waiting')
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     print("6. Complete - showing receipt")
-    display.show_receipt(
-        items=[
-            {'product_name': 'Hand Soap', 'quantity': 8.4, 'unit': 'oz', 'price': 1.26},
-            {'product_name': 'Dish Soap', 'quantity': 7.5, 'unit': 'oz', 'price': 0.90},
-            {'product_name': 'Laundry', 'quantity': 8.0, 'unit': 'oz', 'price': 0.80}
-        ],
-        total=2.96
-    )
-    time.sleep(5)
+    display.show_receipt(items=receipt_items, total=total_so_far)
+    await asyncio.sleep(5)
     
     print("7. Declined card")
     display.change_state('declined')
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     print("8. Error state")
     display.show_error("We're sorry for the inconvenience", error_code="TEST-001")
-    time.sleep(3)
+    await asyncio.sleep(3)
     
     print("\nDemo complete! Returning to idle...")
     
@@ -166,35 +167,43 @@ def manual_mode():
         {'id': 'soap_dish', 'name': 'DISH SOAP', 'unit': 'oz', 'price_per_unit': 0.12},
         {'id': 'soap_laundry', 'name': 'LAUNDRY GEL', 'unit': 'oz', 'price_per_unit': 0.10}
     ]
-    
+
+    # Mock data precomputed once: products and demo quantities are fixed for
+    # the session, so arrow-key handling below is pure I/O with no per-
+    # keystroke arithmetic or list building
+    mock_updates = []
+    for i, product in enumerate(products):
+        qty = (i + 1) * 4.2
+        mock_updates.append({
+            'product_id': product['id'],
+            'product_name': product['name'],
+            'quantity': qty,
+            'unit': product['unit'],
+            'price': qty * product['price_per_unit'],
+        })
+    mock_total = sum(update['price'] for update in mock_updates)
+    receipt_items = [
+        {'product_name': update['product_name'], 'quantity': update['quantity'],
+         'unit': update['unit'], 'price': update['price']}
+        for update in mock_updates
+    ]
+
     def show_state(index):
         state = states[index]
         print(f"\r[{index + 1}/8] {state_names[index]:15} (← prev | next → | q=quit)  ", end='', flush=True)
         display.change_state(state)
-        
-        # Add mock data for dispensing/waiting/complete states
+
+        # Push the precomputed mock data for dispensing/waiting/complete states
         if state in ['dispensing', 'waiting', 'complete']:
-            for i, product in enumerate(products):
-                qty = (i + 1) * 4.2
-                price = qty * product['price_per_unit']
+            for i, update in enumerate(mock_updates):
                 display.update_product(
-                    product_id=product['id'],
-                    product_name=product['name'],
-                    quantity=qty,
-                    unit=product['unit'],
-                    price=price,
-                    is_active=(i == 0 and state == 'dispensing')
+                    is_active=(i == 0 and state == 'dispensing'),
+                    **update
                 )
-            display.update_total(sum((i + 1) * 4.2 * p['price_per_unit'] for i, p in enumerate(products)))
-            
+            display.update_total(mock_total)
+
             if state == 'complete':
-                items = [
-                    {'product_name': p['name'], 'quantity': (i + 1) * 4.2, 
-                     'unit': p['unit'], 'price': (i + 1) * 4.2 * p['price_per_unit']}
-                    for i, p in enumerate(products)
-                ]
-                total = sum(item['price'] for item in items)
-                display.show_receipt(items=items, total=total)
+                display.show_receipt(items=receipt_items, total=mock_total)
         elif state == 'error':
             display.show_error("We're sorry for the inconvenience", error_code="TEST-001")
     
@@ -227,19 +236,21 @@ def manual_mode():
         tty.setcbreak(fd)
         
         while True:
-            if select.select([sys.stdin], [], [], 0.1)[0]:
-                ch = sys.stdin.read(1)
-                
-                if ch == '\x1b':  # Escape sequence
-                    ch = sys.stdin.read(2)
-                    if ch == '[C':  # Right arrow
-                        current_index = (current_index + 1) % len(states)
-                        show_state(current_index)
-                    elif ch == '[D':  # Left arrow
-                        current_index = (current_index - 1) % len(states)
-                        show_state(current_index)
-                elif ch.lower() == 'q':
-                    break
+            # Block until a key arrives instead of polling every 100ms - the
+            # process sleeps in the kernel at zero CPU between keystrokes
+            select.select([sys.stdin], [], [])
+            ch = sys.stdin.read(1)
+
+            if ch == '\x1b':  # Escape sequence
+                ch = sys.stdin.read(2)
+                if ch == '[C':  # Right arrow
+                    current_index = (current_index + 1) % len(states)
+                    show_state(current_index)
+                elif ch == '[D':  # Left arrow
+                    current_index = (current_index - 1) % len(states)
+                    show_state(current_index)
+            elif ch.lower() == 'q':
+                break
                     
     except KeyboardInterrupt:
         pass
@@ -248,6 +259,13 @@ def manual_mode():
         print("\n")
 
 
+async def demo_loop():
+    """Replay the demo forever (iterative - no stacked frames per replay)"""
+    while True:
+        await run_demo()
+        print("\nLooping again in 3 seconds...")
+        await asyncio.sleep(3)
+
 def main():
     """Main entry point"""
     global display
@@ -269,21 +287,22 @@ def main():
     # Initialize and start server
     display = DisplayServer(host='localhost', port=5000, products=products)
     display.start(background=True)
-    
+
+    # Wait until the port is actually live rather than sleeping a guess -
+    # the demo starts the moment the server is up
+    if not display.wait_ready(timeout=5):
+        print("Warning: display server did not come up within 5 seconds")
+
     print(f"\nDisplay server running on http://localhost:5000")
     print("Open in browser\n")
-    
+
     display.change_state('idle')
-    time.sleep(1)
-    
+
     if loop_mode:
         print("LOOP MODE - Continuously cycling through states")
         print("Press Ctrl+C to stop\n")
         try:
-            while True:
-                run_demo()
-                print("\nLooping again in 3 seconds...")
-                time.sleep(3)
+            asyncio.run(demo_loop())
         except KeyboardInterrupt:
             print("\nShutting down...")
             sys.exit(0)
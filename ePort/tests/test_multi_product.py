@@ -3,10 +3,12 @@ Unit tests for multi-product system
 Tests Product, ProductManager, and TransactionTracker classes
 """
 
+import io
 import os
 import json
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from ePort.src.product import Product
 from ePort.src.product_manager import ProductManager
 from ePort.src.transaction_tracker import TransactionTracker
@@ -14,7 +16,26 @@ from ePort.src.transaction_tracker import TransactionTracker
 
 class TestProduct(unittest.TestCase):
     """Test Product class"""
-    
+
+    # Shared kwargs for a valid product; validation cases override one field
+    BASE_KW = {
+        "product_id": "soap",
+        "name": "Soap",
+        "price_per_unit": 0.15,
+        "unit": "oz",
+        "motor_pin": 17,
+        "flowmeter_pin": 24,
+        "button_pin": 4,
+        "pulses_per_unit": 5.4,
+    }
+
+    # (field override, expected error substring)
+    BAD_CASES = [
+        ({"product_id": ""}, "ID cannot be empty"),
+        ({"price_per_unit": -0.15}, "price must be positive"),
+        ({"pulses_per_unit": -5.4}, "pulses_per_unit must be positive"),
+    ]
+
     def test_product_creation(self):
         """Test creating a valid product"""
         product = Product(
@@ -57,57 +78,20 @@ class TestProduct(unittest.TestCase):
         self.assertEqual(product.calculate_price(2.5), 0.38)  # Rounded
         self.assertEqual(product.calculate_price(10.0), 1.50)
     
-    def test_product_validation_empty_id(self):
-        """Test validation fails for empty ID"""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                product_id="",
-                name="Soap",
-                price_per_unit=0.15,
-                unit="oz",
-                motor_pin=17,
-                flowmeter_pin=24,
-                button_pin=4,
-                pulses_per_unit=5.4
-            )
-        self.assertIn("ID cannot be empty", str(context.exception))
-    
-    def test_product_validation_negative_price(self):
-        """Test validation fails for negative price"""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                product_id="soap",
-                name="Soap",
-                price_per_unit=-0.15,
-                unit="oz",
-                motor_pin=17,
-                flowmeter_pin=24,
-                button_pin=4,
-                pulses_per_unit=5.4
-            )
-        self.assertIn("price must be positive", str(context.exception))
-    
-    def test_product_validation_negative_pulses(self):
-        """Test validation fails for negative pulses_per_unit"""
-        with self.assertRaises(ValueError) as context:
-            Product(
-                product_id="soap",
-                name="Soap",
-                price_per_unit=0.15,
-                unit="oz",
-                motor_pin=17,
-                flowmeter_pin=24,
-                button_pin=4,
-                pulses_per_unit=-5.4
-            )
-        self.assertIn("pulses_per_unit must be positive", str(context.exception))
+    def test_validation_errors(self):
+        """Test validation fails with the expected message for each bad field"""
+        for override, expected_msg in self.BAD_CASES:
+            with self.subTest(override=override):
+                with self.assertRaises(ValueError) as context:
+                    Product(**{**self.BASE_KW, **override})
+                self.assertIn(expected_msg, str(context.exception))
 
 
 class TestProductManager(unittest.TestCase):
     """Test ProductManager class"""
     
     def setUp(self):
-        """Create temporary config file for testing"""
+        """Create temp directory for the tests that exercise the file path"""
         self.temp_dir = tempfile.mkdtemp()
         self.config_path = os.path.join(self.temp_dir, "products.json")
     
@@ -118,13 +102,13 @@ class TestProductManager(unittest.TestCase):
         os.rmdir(self.temp_dir)
     
     def create_config(self, products):
-        """Helper to create config file"""
+        """Helper to create config file (for the file-path tests)"""
         with open(self.config_path, 'w') as f:
             json.dump({"products": products}, f)
     
     def test_load_single_product(self):
         """Test loading single product"""
-        self.create_config([{
+        manager = ProductManager.from_dict({"products": [{
             "id": "soap_hand",
             "name": "Hand Soap",
             "price_per_unit": 0.15,
@@ -133,17 +117,15 @@ class TestProductManager(unittest.TestCase):
             "flowmeter_pin": 24,
             "button_pin": 4,
             "pulses_per_unit": 5.4
-        }])
-        
-        manager = ProductManager(self.config_path)
-        
+        }]})
+
         self.assertEqual(manager.get_product_count(), 1)
         product = manager.get_product("soap_hand")
         self.assertEqual(product.name, "Hand Soap")
     
     def test_load_multiple_products(self):
         """Test loading multiple products"""
-        self.create_config([
+        manager = ProductManager.from_dict({"products": [
             {
                 "id": "soap_hand",
                 "name": "Hand Soap",
@@ -164,17 +146,15 @@ class TestProductManager(unittest.TestCase):
                 "button_pin": 23,
                 "pulses_per_unit": 5.2
             }
-        ])
-        
-        manager = ProductManager(self.config_path)
-        
+        ]})
+
         self.assertEqual(manager.get_product_count(), 2)
         self.assertEqual(manager.get_product("soap_hand").name, "Hand Soap")
         self.assertEqual(manager.get_product("soap_dish").name, "Dish Soap")
     
     def test_get_product_by_button_pin(self):
         """Test retrieving product by button pin"""
-        self.create_config([{
+        manager = ProductManager.from_dict({"products": [{
             "id": "soap_hand",
             "name": "Hand Soap",
             "price_per_unit": 0.15,
@@ -183,9 +163,7 @@ class TestProductManager(unittest.TestCase):
             "flowmeter_pin": 24,
             "button_pin": 4,
             "pulses_per_unit": 5.4
-        }])
-        
-        manager = ProductManager(self.config_path)
+        }]})
         product = manager.get_product_by_button_pin(4)
         
         self.assertIsNotNone(product)
@@ -193,7 +171,7 @@ class TestProductManager(unittest.TestCase):
     
     def test_get_product_by_invalid_button_pin(self):
         """Test retrieving product with non-existent button pin"""
-        self.create_config([{
+        manager = ProductManager.from_dict({"products": [{
             "id": "soap_hand",
             "name": "Hand Soap",
             "price_per_unit": 0.15,
@@ -202,71 +180,52 @@ class TestProductManager(unittest.TestCase):
             "flowmeter_pin": 24,
             "button_pin": 4,
             "pulses_per_unit": 5.4
-        }])
-        
-        manager = ProductManager(self.config_path)
+        }]})
         product = manager.get_product_by_button_pin(99)
         
         self.assertIsNone(product)
     
-    def test_duplicate_product_id(self):
-        """Test error on duplicate product ID"""
-        self.create_config([
-            {
-                "id": "soap",
-                "name": "Hand Soap",
-                "price_per_unit": 0.15,
-                "unit": "oz",
-                "motor_pin": 17,
-                "flowmeter_pin": 24,
-                "button_pin": 4,
-                "pulses_per_unit": 5.4
-            },
-            {
-                "id": "soap",
-                "name": "Dish Soap",
-                "price_per_unit": 0.12,
-                "unit": "oz",
-                "motor_pin": 18,
-                "flowmeter_pin": 25,
-                "button_pin": 23,
-                "pulses_per_unit": 5.2
-            }
-        ])
-        
-        with self.assertRaises(ValueError) as context:
-            ProductManager(self.config_path)
-        self.assertIn("Duplicate product ID", str(context.exception))
-    
-    def test_duplicate_motor_pin(self):
-        """Test error on duplicate motor pin"""
-        self.create_config([
-            {
-                "id": "soap_hand",
-                "name": "Hand Soap",
-                "price_per_unit": 0.15,
-                "unit": "oz",
-                "motor_pin": 17,
-                "flowmeter_pin": 24,
-                "button_pin": 4,
-                "pulses_per_unit": 5.4
-            },
-            {
-                "id": "soap_dish",
-                "name": "Dish Soap",
-                "price_per_unit": 0.12,
-                "unit": "oz",
-                "motor_pin": 17,  # Duplicate!
-                "flowmeter_pin": 25,
-                "button_pin": 23,
-                "pulses_per_unit": 5.2
-            }
-        ])
-        
-        with self.assertRaises(ValueError) as context:
-            ProductManager(self.config_path)
-        self.assertIn("motor_pin", str(context.exception))
-        self.assertIn("already used", str(context.exception))
+    # (field made to collide between the two products, expected error substrings)
+    DUPLICATE_CASES = [
+        ("id", ["Duplicate product ID"]),
+        ("motor_pin", ["motor_pin", "already used"]),
+        ("flowmeter_pin", ["flowmeter_pin", "already used"]),
+        ("button_pin", ["button_pin", "already used"]),
+    ]
+
+    def test_duplicate_config_errors(self):
+        """Test error when two products share an ID or a GPIO pin"""
+        for field, expected_msgs in self.DUPLICATE_CASES:
+            with self.subTest(field=field):
+                products = [
+                    {
+                        "id": "soap_hand",
+                        "name": "Hand Soap",
+                        "price_per_unit": 0.15,
+                        "unit": "oz",
+                        "motor_pin": 17,
+                        "flowmeter_pin": 24,
+                        "button_pin": 4,
+                        "pulses_per_unit": 5.4
+                    },
+                    {
+                        "id": "soap_dish",
+                        "name": "Dish Soap",
+                        "price_per_unit": 0.12,
+                        "unit": "oz",
+                        "motor_pin": 18,
+                        "flowmeter_pin": 25,
+                        "button_pin": 23,
+                        "pulses_per_unit": 5.2
+                    }
+                ]
+                # Copy the colliding value from the first product to the second
+                products[1][field] = products[0][field]
+
+                with self.assertRaises(ValueError) as context:
+                    ProductManager.from_dict({"products": products})
+                for expected_msg in expected_msgs:
+                    self.assertIn(expected_msg, str(context.exception))
     
     def test_missing_config_file(self):
         """Test error when config file doesn't exist"""
@@ -281,22 +240,35 @@ class TestProductManager(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             ProductManager(self.config_path)
         self.assertIn("Invalid JSON", str(context.exception))
+
+    def test_load_from_stream(self):
+        """Test loading from a file-like object"""
+        stream = io.StringIO(json.dumps({"products": [{
+            "id": "soap_hand",
+            "name": "Hand Soap",
+            "price_per_unit": 0.15,
+            "unit": "oz",
+            "motor_pin": 17,
+            "flowmeter_pin": 24,
+            "button_pin": 4,
+            "pulses_per_unit": 5.4
+        }]}))
+
+        manager = ProductManager.from_stream(stream)
+
+        self.assertEqual(manager.get_product_count(), 1)
+        self.assertEqual(manager.get_product("soap_hand").name, "Hand Soap")
     
     def test_missing_products_key(self):
         """Test error when 'products' key is missing"""
-        with open(self.config_path, 'w') as f:
-            json.dump({"items": []}, f)
-        
         with self.assertRaises(ValueError) as context:
-            ProductManager(self.config_path)
+            ProductManager.from_dict({"items": []})
         self.assertIn("'products' key", str(context.exception))
     
     def test_empty_products_list(self):
         """Test error when products list is empty"""
-        self.create_config([])
-        
         with self.assertRaises(ValueError) as context:
-            ProductManager(self.config_path)
+            ProductManager.from_dict({"products": []})
         self.assertIn("At least one product", str(context.exception))
 
 
@@ -400,13 +372,14 @@ class TestTransactionTracker(unittest.TestCase):
         self.assertEqual(tracker.get_item_count(), 0)
     
     def test_price_rounding(self):
-        """Test price rounding to 2 decimal places"""
+        """Test prices accumulate exactly as integer cents"""
         tracker = TransactionTracker()
         tracker.add_item("soap", "Soap", 1.0, "oz", 0.33)
         tracker.add_item("soap", "Soap", 1.0, "oz", 0.33)
         tracker.add_item("soap", "Soap", 1.0, "oz", 0.34)
-        
-        # 0.33 + 0.33 + 0.34 = 1.00
+
+        # 33 + 33 + 34 = 100 cents exactly - no float accumulation involved
+        self.assertEqual(tracker.get_total_cents(), 100)
         self.assertEqual(tracker.get_total(), 1.00)
     
     def test_get_product_totals_single_product(self):
@@ -561,32 +534,48 @@ class TestTransactionTracker(unittest.TestCase):
         self.assertEqual(tracker.get_total(), 2.13)  # 1.68 + 0.45
 
 
+def _run_test_class(test_case_class):
+    """
+    Run one TestCase class with its output buffered
+
+    Buffering into a StringIO keeps the per-class output contiguous when
+    classes run concurrently; the caller prints each block after the fact.
+    """
+    stream = io.StringIO()
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(test_case_class)
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+    result = runner.run(suite)
+    return result, stream.getvalue()
+
+
 def run_all_tests():
     """Run all multi-product tests"""
     print("=" * 60)
     print("Testing Multi-Product System")
     print("=" * 60)
-    
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    suite.addTests(loader.loadTestsFromTestCase(TestProduct))
-    suite.addTests(loader.loadTestsFromTestCase(TestProductManager))
-    suite.addTests(loader.loadTestsFromTestCase(TestTransactionTracker))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
+
+    # The three classes share no state (ProductManager tests use their own
+    # temp dirs), so run one per worker and overlap the fixture I/O
+    test_classes = [TestProduct, TestProductManager, TestTransactionTracker]
+    with ThreadPoolExecutor(max_workers=len(test_classes)) as executor:
+        outcomes = list(executor.map(_run_test_class, test_classes))
+
+    # Replay each class's buffered output, then aggregate the results
+    tests_run = failures = errors = 0
+    for result, output in outcomes:
+        print(output, end='')
+        tests_run += result.testsRun
+        failures += len(result.failures)
+        errors += len(result.errors)
+
     # Print summary
     print("\n" + "=" * 60)
-    print(f"Results: {result.testsRun} tests, "
-          f"{len(result.failures)} failures, "
-          f"{len(result.errors)} errors")
+    print(f"Results: {tests_run} tests, "
+          f"{failures} failures, "
+          f"{errors} errors")
     print("=" * 60)
-    
-    return result.wasSuccessful()
+
+    return failures == 0 and errors == 0
 
 
 if __name__ == '__main__':